@@ -72,8 +72,13 @@ class MultipleCheckboxWidget(QtWidgets.QWidget):
         return checkbox_states
 
     def setData(self, data):
+        # Apply all checkbox states with a single repaint and a single stateChanged emission
+        self.setUpdatesEnabled(False)
+        was_blocked = self.blockSignals(True)
         for label, state in data.items():
             self._checkboxes[label]['widget'].setChecked(state)
+        self.blockSignals(was_blocked)
+        self.setUpdatesEnabled(True)
         self.stateChanged.emit()
         return
 
@@ -26,11 +26,31 @@ from qudi.gui.pulsed.pulsed_custom_widgets import MultipleCheckboxWidget, Analog
 from qudi.util.widgets.scientific_spinbox import ScienDSpinBox
 
 
-class CheckBoxItemDelegate(QtWidgets.QStyledItemDelegate):
-    """
+class _ItemDelegateBase(QtWidgets.QStyledItemDelegate):
+    """ Common base class for all pulse editor item delegates.
     """
     editingFinished = QtCore.Signal()
 
+    def commitAndCloseEditor(self):
+        editor = self.sender()
+        self.commitData.emit(editor)
+        # self.closeEditor.emit(editor)
+        self.editingFinished.emit()
+        return
+
+    @staticmethod
+    def _is_clipped(painter, option):
+        """ Check if the cell to paint lies completely outside the clip region of the painter.
+        """
+        if not painter.hasClipping():
+            return False
+        return not painter.clipBoundingRect().intersects(QtCore.QRectF(option.rect))
+
+
+class CheckBoxItemDelegate(_ItemDelegateBase):
+    """
+    """
+
     def __init__(self, parent, data_access_role=QtCore.Qt.DisplayRole):
         """
         @param QWidget parent: the parent QWidget which hosts this child widget
@@ -65,13 +85,6 @@ class CheckBoxItemDelegate(QtWidgets.QStyledItemDelegate):
         editor.stateChanged.connect(self.commitAndCloseEditor)
         return editor
 
-    def commitAndCloseEditor(self):
-        editor = self.sender()
-        self.commitData.emit(editor)
-        # self.closeEditor.emit(editor)
-        self.editingFinished.emit()
-        return
-
     def sizeHint(self):
         return QtCore.QSize(15, 50)
 
@@ -87,7 +100,7 @@ class CheckBoxItemDelegate(QtWidgets.QStyledItemDelegate):
         understood by the editor.
         """
         data = index.data(self._access_role)
-        if not isinstance(data, bool):
+        if type(data) is not bool:
             return
         editor.blockSignals(True)
         editor.setChecked(data)
@@ -114,20 +127,21 @@ class CheckBoxItemDelegate(QtWidgets.QStyledItemDelegate):
         return
 
     def paint(self, painter, option, index):
-        painter.save()
-        r = option.rect
-        painter.translate(r.topLeft())
-        widget = QtWidgets.QCheckBox()
-        widget.setGeometry(r)
-        widget.setChecked(index.data(self._access_role))
-        widget.render(painter, QtCore.QPoint(0, 0), painter.viewport())
-        painter.restore()
+        # Let the style draw the checkbox directly instead of rendering a QCheckBox widget
+        checkbox_option = QtWidgets.QStyleOptionButton()
+        checkbox_option.rect = option.rect
+        checkbox_option.state = QtWidgets.QStyle.State_Enabled
+        if index.data(self._access_role):
+            checkbox_option.state |= QtWidgets.QStyle.State_On
+        else:
+            checkbox_option.state |= QtWidgets.QStyle.State_Off
+        style = QtWidgets.QApplication.style() if option.widget is None else option.widget.style()
+        style.drawControl(QtWidgets.QStyle.CE_CheckBox, checkbox_option, painter)
 
 
-class SpinBoxItemDelegate(QtWidgets.QStyledItemDelegate):
+class SpinBoxItemDelegate(_ItemDelegateBase):
     """
     """
-    editingFinished = QtCore.Signal()
 
     def __init__(self, parent, item_dict=None, data_access_role=QtCore.Qt.DisplayRole):
         """
@@ -141,6 +155,8 @@ class SpinBoxItemDelegate(QtWidgets.QStyledItemDelegate):
             item_dict = dict()
         self.item_dict = item_dict
         self._access_role = data_access_role
+        # Widget used to render all cells in paint, created on first use
+        self._paint_widget = None
         return
 
     def createEditor(self, parent, option, index):
@@ -175,13 +191,6 @@ class SpinBoxItemDelegate(QtWidgets.QStyledItemDelegate):
         editor.editingFinished.connect(self.commitAndCloseEditor)
         return editor
 
-    def commitAndCloseEditor(self):
-        editor = self.sender()
-        self.commitData.emit(editor)
-        # self.closeEditor.emit(editor)
-        self.editingFinished.emit()
-        return
-
     def sizeHint(self):
         return QtCore.QSize(90, 50)
 
@@ -224,26 +233,27 @@ class SpinBoxItemDelegate(QtWidgets.QStyledItemDelegate):
         return
 
     def paint(self, painter, option, index):
+        if self._paint_widget is None:
+            self._paint_widget = QtWidgets.QSpinBox()
+            if 'min' in self.item_dict:
+                self._paint_widget.setMinimum(self.item_dict['min'])
+            if 'max' in self.item_dict:
+                self._paint_widget.setMaximum(self.item_dict['max'])
+            if 'unit' in self.item_dict:
+                self._paint_widget.setSuffix(self.item_dict['unit'])
+        widget = self._paint_widget
         painter.save()
         r = option.rect
         painter.translate(r.topLeft())
-        widget = QtWidgets.QSpinBox()
-        if 'min' in self.item_dict:
-            widget.setMinimum(self.item_dict['min'])
-        if 'max' in self.item_dict:
-            widget.setMaximum(self.item_dict['max'])
-        if 'unit' in self.item_dict:
-            widget.setSuffix(self.item_dict['unit'])
         widget.setGeometry(r)
         widget.setValue(index.data(self._access_role))
         widget.render(painter, QtCore.QPoint(0, 0), painter.viewport())
         painter.restore()
 
 
-class ScienDSpinBoxItemDelegate(QtWidgets.QStyledItemDelegate):
+class ScienDSpinBoxItemDelegate(_ItemDelegateBase):
     """
     """
-    editingFinished = QtCore.Signal()
 
     def __init__(self, parent, item_dict, data_access_role=QtCore.Qt.DisplayRole):
         """
@@ -254,6 +264,8 @@ class ScienDSpinBoxItemDelegate(QtWidgets.QStyledItemDelegate):
         super().__init__(parent)
         self.item_dict = item_dict
         self._access_role = data_access_role
+        # Widget used to render all cells in paint, created on first use
+        self._paint_widget = None
         # Note, the editor used in this delegate creates the unit prefix by
         # itself, therefore no handling for that is implemented.
         return
@@ -292,13 +304,6 @@ class ScienDSpinBoxItemDelegate(QtWidgets.QStyledItemDelegate):
         editor.editingFinished.connect(self.commitAndCloseEditor)
         return editor
 
-    def commitAndCloseEditor(self):
-        editor = self.sender()
-        self.commitData.emit(editor)
-        # self.closeEditor.emit(editor)
-        self.editingFinished.emit()
-        return
-
     def sizeHint(self):
         return QtCore.QSize(90, 50)
 
@@ -341,24 +346,25 @@ class ScienDSpinBoxItemDelegate(QtWidgets.QStyledItemDelegate):
         return
 
     def paint(self, painter, option, index):
+        if self._paint_widget is None:
+            self._paint_widget = ScienDSpinBox()
+            if 'dec' in self.item_dict:
+                self._paint_widget.setDecimals(self.item_dict['dec'])
+            if 'unit' in self.item_dict:
+                self._paint_widget.setSuffix(self.item_dict['unit'])
+        widget = self._paint_widget
         painter.save()
         r = option.rect
         painter.translate(r.topLeft())
-        widget = ScienDSpinBox()
-        if 'dec' in self.item_dict:
-            widget.setDecimals(self.item_dict['dec'])
-        if 'unit' in self.item_dict:
-            widget.setSuffix(self.item_dict['unit'])
         widget.setGeometry(r)
         widget.setValue(index.data(self._access_role))
         widget.render(painter, QtCore.QPoint(0, 0), painter.viewport())
         painter.restore()
 
 
-class ComboBoxItemDelegate(QtWidgets.QStyledItemDelegate):
+class ComboBoxItemDelegate(_ItemDelegateBase):
     """
     """
-    editingFinished = QtCore.Signal()
 
     def __init__(self, parent, item_list, data_access_role=QtCore.Qt.DisplayRole,
                  size=QtCore.QSize(80, 50)):
@@ -394,13 +400,6 @@ class ComboBoxItemDelegate(QtWidgets.QStyledItemDelegate):
         widget.currentIndexChanged.connect(self.commitAndCloseEditor)
         return widget
 
-    def commitAndCloseEditor(self):
-        editor = self.sender()
-        self.commitData.emit(editor)
-        # self.closeEditor.emit(editor)
-        self.editingFinished.emit()
-        return
-
     def sizeHint(self):
         return self._size
 
@@ -438,26 +437,28 @@ class ComboBoxItemDelegate(QtWidgets.QStyledItemDelegate):
         return
 
     def paint(self, painter, option, index):
-        painter.save()
-        r = option.rect
-        painter.translate(r.topLeft())
-        widget = QtWidgets.QComboBox()
-        widget.addItem(index.data(self._access_role))
-        widget.setGeometry(r)
-        widget.render(painter, QtCore.QPoint(0, 0), painter.viewport())
-        painter.restore()
+        # Let the style draw the combobox frame and label instead of rendering a QComboBox widget
+        combo_option = QtWidgets.QStyleOptionComboBox()
+        combo_option.rect = option.rect
+        combo_option.state = QtWidgets.QStyle.State_Enabled
+        combo_option.currentText = index.data(self._access_role) or ''
+        style = QtWidgets.QApplication.style() if option.widget is None else option.widget.style()
+        style.drawComplexControl(QtWidgets.QStyle.CC_ComboBox, combo_option, painter)
+        style.drawControl(QtWidgets.QStyle.CE_ComboBoxLabel, combo_option, painter)
 
 
-class MultipleCheckboxItemDelegate(QtWidgets.QStyledItemDelegate):
+class MultipleCheckboxItemDelegate(_ItemDelegateBase):
     """
     """
-    editingFinished = QtCore.Signal()
 
     def __init__(self, parent, label_list, data_access_role=QtCore.Qt.DisplayRole):
 
         super().__init__(parent)
         self._label_list = list() if label_list is None else list(label_list)
         self._access_role = data_access_role
+        self._size_hint = None
+        # Widget used to render all cells in paint, created on first use
+        self._paint_widget = None
         return
 
     def createEditor(self, parent, option, index):
@@ -481,20 +482,14 @@ class MultipleCheckboxItemDelegate(QtWidgets.QStyledItemDelegate):
         needed any longer.
         """
         editor = MultipleCheckboxWidget(parent, self._label_list)
-        editor.setData(index.data(self._access_role))
         editor.stateChanged.connect(self.commitAndCloseEditor)
         return editor
 
-    def commitAndCloseEditor(self):
-        editor = self.sender()
-        self.commitData.emit(editor)
-        # self.closeEditor.emit(editor)
-        self.editingFinished.emit()
-        return
-
     def sizeHint(self):
-        widget = MultipleCheckboxWidget(None, self._label_list)
-        return widget.sizeHint()
+        # The label list is static, so the widget only needs to be created once
+        if self._size_hint is None:
+            self._size_hint = MultipleCheckboxWidget(None, self._label_list).sizeHint()
+        return self._size_hint
 
     def setEditorData(self, editor, index):
         """
@@ -531,19 +526,22 @@ class MultipleCheckboxItemDelegate(QtWidgets.QStyledItemDelegate):
         return
 
     def paint(self, painter, option, index):
+        if self._is_clipped(painter, option):
+            return
         painter.save()
         r = option.rect
         painter.translate(r.topLeft())
-        widget = MultipleCheckboxWidget(None, self._label_list)
+        if self._paint_widget is None:
+            self._paint_widget = MultipleCheckboxWidget(None, self._label_list)
+        widget = self._paint_widget
         widget.setData(index.data(self._access_role))
         widget.render(painter, QtCore.QPoint(0, 0), painter.viewport())
         painter.restore()
 
 
-class AnalogParametersItemDelegate(QtWidgets.QStyledItemDelegate):
+class AnalogParametersItemDelegate(_ItemDelegateBase):
     """
     """
-    editingFinished = QtCore.Signal()
 
     def __init__(self, parent, data_access_roles=None):
         super().__init__(parent)
@@ -551,6 +549,10 @@ class AnalogParametersItemDelegate(QtWidgets.QStyledItemDelegate):
             self._access_role = [QtCore.Qt.DisplayRole, QtCore.Qt.DisplayRole]
         else:
             self._access_role = data_access_roles
+        # Size hints for already encountered parameter sets
+        self._size_hints = dict()
+        # Widgets used in paint for already encountered sampling function types
+        self._paint_widgets = dict()
 
     def createEditor(self, parent, option, index):
         """
@@ -574,21 +576,17 @@ class AnalogParametersItemDelegate(QtWidgets.QStyledItemDelegate):
         """
         parameters = index.data(self._access_role[0]).params
         editor = AnalogParametersWidget(parent, parameters)
-        editor.setData(index.data(self._access_role[1]))
         editor.editingFinished.connect(self.commitAndCloseEditor)
         return editor
 
-    def commitAndCloseEditor(self):
-        editor = self.sender()
-        self.commitData.emit(editor)
-        # self.closeEditor.emit(editor)
-        self.editingFinished.emit()
-        return
-
     def sizeHint(self, option, index):
         parameters = index.data(self._access_role[0]).params
-        widget = AnalogParametersWidget(None, parameters)
-        return widget.sizeHint()
+        key = tuple(parameters)
+        size_hint = self._size_hints.get(key, None)
+        if size_hint is None:
+            size_hint = AnalogParametersWidget(None, parameters).sizeHint()
+            self._size_hints[key] = size_hint
+        return size_hint
 
     def setEditorData(self, editor, index):
         """
@@ -625,11 +623,17 @@ class AnalogParametersItemDelegate(QtWidgets.QStyledItemDelegate):
         return
 
     def paint(self, painter, option, index):
+        if self._is_clipped(painter, option):
+            return
         painter.save()
         r = option.rect
         painter.translate(r.topLeft())
-        parameters = index.data(self._access_role[0]).params
-        widget = AnalogParametersWidget(None, parameters)
+        # Parameter definitions are class attributes of the sampling function
+        sampling_function = index.data(self._access_role[0])
+        widget = self._paint_widgets.get(type(sampling_function), None)
+        if widget is None:
+            widget = AnalogParametersWidget(None, sampling_function.params)
+            self._paint_widgets[type(sampling_function)] = widget
         widget.setData(index.data(self._access_role[1]))
         widget.render(painter, QtCore.QPoint(0, 0), painter.viewport())
         painter.restore()
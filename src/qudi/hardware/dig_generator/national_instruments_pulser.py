@@ -23,6 +23,8 @@ If not, see <https://www.gnu.org/licenses/>.
 from qudi.util.paths import get_home_dir
 import numpy as np
 import ctypes
+import copy
+import logging
 import os
 
 import PyDAQmx as daq
@@ -30,7 +32,6 @@ import PyDAQmx as daq
 from qudi.core.module import Base
 from qudi.core.configoption import ConfigOption
 from qudi.interface.pulser_interface import PulserInterface
-from collections import OrderedDict
 
 
 class NationalInstrumentsPulser(Base, PulserInterface):
@@ -48,6 +49,10 @@ class NationalInstrumentsPulser(Base, PulserInterface):
 
     device = ConfigOption('device', default='Dev0', missing='warn')
 
+    # Constraints and channel map per device name, kept across activations.
+    # Items are tuples (serial number, constraints, channel map).
+    _constraints_cache = dict()
+
     def on_activate(self):
         """ Activate module
         """
@@ -73,7 +78,11 @@ class NationalInstrumentsPulser(Base, PulserInterface):
                 'as directory for the pulsed files!\nThe default home directory\n{0}\n'
                 'will be taken instead.'.format(self.pulsed_file_dir))
 
+        # Absolute paths of the pulsed sub-directories already resolved and created
+        self._dir_cache = dict()
         self.host_waveform_directory = self._get_dir_for_name('sampled_hardware_files')
+        # Tuple (directory modification time, file names) of the last host directory listing
+        self._host_filenames_cache = None
 
         self.pulser_task = daq.TaskHandle()
         daq.DAQmxCreateTask('NI Pulser', daq.byref(self.pulser_task))
@@ -89,6 +98,13 @@ class NationalInstrumentsPulser(Base, PulserInterface):
 
         self.a_names = []
         self.d_names = []
+        # Comma separated channel lists for DAQmx, updated on channel changes
+        self._a_channels_str = ''
+        self._a_names_str = ''
+        self._d_channels_str = ''
+        self._d_names_str = ''
+        # Settings the pulser task was last configured with (None if not configured)
+        self._configured_task_settings = None
 
         self.set_active_channels({
             k: True for k in self.constraints['activation_config']['analog_only']})
@@ -103,22 +119,29 @@ class NationalInstrumentsPulser(Base, PulserInterface):
         """ Build a pulser constraints dictionary with information from the NI card.
         """
         device = self.device
+
+        # Reuse constraints from a previous activation if the card has not changed
+        serial_num = daq.uInt32()
+        daq.DAQmxGetDevSerialNum(device, daq.byref(serial_num))
+        self.log.debug('Card serial number: {0}'.format(serial_num.value))
+        cached = self._constraints_cache.get(device, None)
+        if cached is not None and cached[0] == serial_num.value:
+            self.constraints = copy.deepcopy(cached[1])
+            self.channel_map = copy.deepcopy(cached[2])
+            return
+
         constraints = {}
-        ch_map = OrderedDict()
+        ch_map = dict()
 
         n = 2048
         ao_max_freq = daq.float64()
         ao_min_freq = daq.float64()
         ao_physical_chans = ctypes.create_string_buffer(n)
-        ao_voltage_ranges = np.zeros(16, dtype=np.float64)
+        ao_voltage_ranges = (ctypes.c_double * 16)()
         ao_clock_support = daq.bool32()
         do_max_freq = daq.float64()
         do_lines = ctypes.create_string_buffer(n)
         do_ports = ctypes.create_string_buffer(n)
-        product_dev_type = ctypes.create_string_buffer(n)
-        product_cat = daq.int32()
-        serial_num = daq.uInt32()
-        product_num = daq.uInt32()
 
         daq.DAQmxGetDevAOMinRate(device, daq.byref(ao_min_freq))
         self.log.debug('Analog min freq: {0}'.format(ao_min_freq.value))
@@ -129,10 +152,7 @@ class NationalInstrumentsPulser(Base, PulserInterface):
         daq.DAQmxGetDevAOPhysicalChans(device, ao_physical_chans, n)
         analog_channels = str(ao_physical_chans.value, encoding='utf-8').split(', ')
         self.log.debug('Analog channels: {0}'.format(analog_channels))
-        daq.DAQmxGetDevAOVoltageRngs(
-            device,
-            ao_voltage_ranges.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
-            len(ao_voltage_ranges))
+        daq.DAQmxGetDevAOVoltageRngs(device, ao_voltage_ranges, len(ao_voltage_ranges))
         self.log.debug('Analog voltage range: {0}'.format(ao_voltage_ranges[0:2]))
 
         daq.DAQmxGetDevDOMaxRate(self.device, daq.byref(do_max_freq))
@@ -144,15 +164,18 @@ class NationalInstrumentsPulser(Base, PulserInterface):
         digital_bundles = str(do_ports.value, encoding='utf-8').split(', ')
         self.log.debug('Digital ports: {0}'.format(digital_bundles))
 
-        daq.DAQmxGetDevSerialNum(device, daq.byref(serial_num))
-        self.log.debug('Card serial number: {0}'.format(serial_num.value))
-        daq.DAQmxGetDevProductNum(device, daq.byref(product_num))
-        self.log.debug('Product number: {0}'.format(product_num.value))
-        daq.DAQmxGetDevProductType(device, product_dev_type, n)
-        product = str(product_dev_type.value, encoding='utf-8')
-        self.log.debug('Product name: {0}'.format(product))
-        daq.DAQmxGetDevProductCategory(device, daq.byref(product_cat))
-        self.log.debug(product_cat.value)
+        # product information is only used for debug output
+        if self.log.isEnabledFor(logging.DEBUG):
+            product_dev_type = ctypes.create_string_buffer(n)
+            product_cat = daq.int32()
+            product_num = daq.uInt32()
+            daq.DAQmxGetDevProductNum(device, daq.byref(product_num))
+            self.log.debug('Product number: {0}'.format(product_num.value))
+            daq.DAQmxGetDevProductType(device, product_dev_type, n)
+            product = str(product_dev_type.value, encoding='utf-8')
+            self.log.debug('Product name: {0}'.format(product))
+            daq.DAQmxGetDevProductCategory(device, daq.byref(product_cat))
+            self.log.debug(product_cat.value)
 
         for n, ch in enumerate(analog_channels):
             ch_map['a_ch{0:d}'.format(n+1)] = ch
@@ -221,10 +244,10 @@ class NationalInstrumentsPulser(Base, PulserInterface):
 
         # If sequencer mode is enable than sequence_param should be not just an
         # empty dictionary.
-        sequence_param = OrderedDict()
+        sequence_param = dict()
         constraints['sequence_param'] = sequence_param
 
-        activation_config = OrderedDict()
+        activation_config = dict()
         activation_config['analog_only'] = [k for k in ch_map.keys() if k.startswith('a')]
         activation_config['digital_only'] = [k for k in ch_map.keys() if k.startswith('d')]
         activation_config['stuff'] = ['a_ch4', 'd_ch1', 'd_ch2', 'd_ch3', 'd_ch4']
@@ -232,34 +255,41 @@ class NationalInstrumentsPulser(Base, PulserInterface):
 
         self.channel_map = ch_map
         self.constraints = constraints
+        self._constraints_cache[device] = (serial_num.value,
+                                           copy.deepcopy(constraints),
+                                           copy.deepcopy(ch_map))
 
     def configure_pulser_task(self):
         """ Clear pulser task and set to current settings.
 
         @return:
         """
-        a_channels = [self.channel_map[k] for k in self.a_names]
-        d_channels = [self.channel_map[k] for k in self.d_names]
+        # nothing to do if the task is already configured with these settings
+        settings = (tuple(self.a_names), tuple(self.d_names), self.sample_rate,
+                    self.min_volts, self.max_volts)
+        if settings == self._configured_task_settings:
+            return
 
         # clear task
         daq.DAQmxClearTask(self.pulser_task)
+        self._configured_task_settings = None
 
         # add channels
-        if len(a_channels) > 0:
+        if len(self.a_names) > 0:
             daq.DAQmxCreateAOVoltageChan(
                 self.pulser_task,
-                ', '.join(a_channels),
-                ', '.join(self.a_names),
+                self._a_channels_str,
+                self._a_names_str,
                 self.min_volts,
                 self.max_volts,
                 daq.DAQmx_Val_Volts,
                 '')
 
-        if len(d_channels) > 0:
+        if len(self.d_names) > 0:
             daq.DAQmxCreateDOChan(
                 self.pulser_task,
-                ', '.join(d_channels),
-                ', '.join(self.d_names),
+                self._d_channels_str,
+                self._d_names_str,
                 daq.DAQmx_Val_ChanForAllLines)
 
         # set sampling frequency
@@ -271,6 +301,8 @@ class NationalInstrumentsPulser(Base, PulserInterface):
                 daq.DAQmx_Val_ContSamps,
                 10 * self.sample_rate)
 
+        self._configured_task_settings = settings
+
         # write assets
 
     def close_pulser_task(self):
@@ -290,6 +322,7 @@ class NationalInstrumentsPulser(Base, PulserInterface):
         except:
             self.log.exception('Error while clearing NI pulser.')
             retval = -1
+        self._configured_task_settings = None
         return retval
 
     def get_constraints(self):
@@ -366,14 +399,13 @@ class NationalInstrumentsPulser(Base, PulserInterface):
             return 0
 
         # check if asset exists
-        saved_assets = self.get_saved_asset_names()
-        if asset_name not in saved_assets:
+        filepath = os.path.join(self.host_waveform_directory, f'{asset_name}.npz')
+        if not os.path.isfile(filepath):
             self.log.error('No asset with name "{0}" found for NI pulser.\n'
                            '"load_asset" call ignored.'.format(asset_name))
             return -1
 
         # get samples from file
-        filepath = os.path.join(self.host_waveform_directory, asset_name + '.npz')
         self.samples = np.load(filepath)
 
         self.current_loaded_asset = asset_name
@@ -608,10 +640,10 @@ class NationalInstrumentsPulser(Base, PulserInterface):
         buffer_size = 2048
         buf = ctypes.create_string_buffer(buffer_size)
         daq.DAQmxGetTaskChannels(self.pulser_task, buf, buffer_size)
-        ni_ch = str(buf.value, encoding='utf-8').split(', ')
+        ni_ch = frozenset(str(buf.value, encoding='utf-8').split(', '))
 
         if ch is None:
-            return {k: k in ni_ch for k, v in self.channel_map.items()}
+            return {k: k in ni_ch for k in self.channel_map}
         else:
             return {k: k in ni_ch for k in ch}
 
@@ -644,11 +676,24 @@ class NationalInstrumentsPulser(Base, PulserInterface):
         digital channel 1. All other available channels will remain unchanged.
         """
 
-        self.a_names = [k for k, v in ch.items() if k.startswith('a') and v]
-        self.a_names.sort()
-
-        self.d_names = [k for k, v in ch.items() if k.startswith('d') and v]
-        self.d_names.sort()
+        a_names = []
+        d_names = []
+        for k, v in ch.items():
+            if not v:
+                continue
+            if k.startswith('a'):
+                a_names.append(k)
+            elif k.startswith('d'):
+                d_names.append(k)
+        a_names.sort()
+        d_names.sort()
+        self.a_names = a_names
+        self.d_names = d_names
+
+        self._a_channels_str = ', '.join(self.channel_map[k] for k in self.a_names)
+        self._a_names_str = ', '.join(self.a_names)
+        self._d_channels_str = ', '.join(self.channel_map[k] for k in self.d_names)
+        self._d_names_str = ', '.join(self.d_names)
 
         # apply changed channels
         self.configure_pulser_task()
@@ -672,13 +717,10 @@ class NationalInstrumentsPulser(Base, PulserInterface):
         @return list: List of all saved asset name strings in the current
                       directory of the host PC.
         """
+        # File names within a directory are unique, so are the asset names derived from them
         file_list = self._get_filenames_on_host()
-        saved_assets = []
-        for filename in file_list:
-            if filename.endswith('.npz'):
-                asset_name = filename.rsplit('.', 1)[0]
-                if asset_name not in saved_assets:
-                    saved_assets.append(asset_name)
+        saved_assets = [filename.rsplit('.', 1)[0] for filename in file_list
+                        if filename.endswith('.npz')]
         return saved_assets
 
     def delete_asset(self, asset_name):
@@ -783,16 +825,23 @@ class NationalInstrumentsPulser(Base, PulserInterface):
         @param name: string, name of the folder
         @return: string, absolute path to the directory with folder 'name'.
         """
-        path = os.path.join(self.pulsed_file_dir, name)
-        if not os.path.exists(path):
-            os.makedirs(os.path.abspath(path))
-        return os.path.abspath(path)
+        path = self._dir_cache.get(name)
+        if path is None:
+            path = os.path.abspath(os.path.join(self.pulsed_file_dir, name))
+            os.makedirs(path, exist_ok=True)
+            self._dir_cache[name] = path
+        return path
 
     def _get_filenames_on_host(self):
         """ Get the full filenames of all assets saved on the host PC.
 
         @return: list, The full filenames of all assets saved on the host PC.
         """
-        filename_list = [f for f in os.listdir(self.host_waveform_directory) if f.endswith('.npz')]
-        return filename_list
+        # The directory content can only have changed if its modification time did
+        mtime = os.stat(self.host_waveform_directory).st_mtime_ns
+        if self._host_filenames_cache is None or self._host_filenames_cache[0] != mtime:
+            with os.scandir(self.host_waveform_directory) as entries:
+                filename_list = [entry.name for entry in entries if entry.name.endswith('.npz')]
+            self._host_filenames_cache = (mtime, filename_list)
+        return list(self._host_filenames_cache[1])
 
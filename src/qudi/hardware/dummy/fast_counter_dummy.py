@@ -38,12 +38,22 @@ class FastCounterDummy(FastCounterInterface):
         options:
             gated: False
             #load_trace: None # path to the saved dummy trace
+            #simulate_delay: True # set False to skip the artificial hardware delays
 
     """
 
     # config option
     _gated = ConfigOption('gated', False, missing='warn')
     trace_path = ConfigOption('load_trace', None)
+    _simulate_delay = ConfigOption(name='simulate_delay', default=True, missing='nothing')
+
+    # Duration of a single hardware time bin in seconds (950 MHz clock)
+    _bin_duration = 1 / 950e6
+    # Available binwidths in seconds, i.e. multiples of the hardware bin duration
+    _hardware_binwidths = (_bin_duration, 2 * _bin_duration, 4 * _bin_duration, 8 * _bin_duration)
+
+    # Parsed dummy traces shared by all instances, keyed by (trace path, gated)
+    _trace_cache = dict()
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -106,7 +116,7 @@ class FastCounterDummy(FastCounterInterface):
 
         # the unit of those entries are seconds per bin. In order to get the
         # current binwidth in seonds use the get_binwidth method.
-        constraints['hardware_binwidth_list'] = [1/950e6, 2/950e6, 4/950e6, 8/950e6]
+        constraints['hardware_binwidth_list'] = list(self._hardware_binwidths)
 
         return constraints
 
@@ -125,9 +135,9 @@ class FastCounterDummy(FastCounterInterface):
                     gate_length_s: the actual set gate length in seconds
                     number_of_gates: the number of gated, which are accepted
         """
-        self._binwidth = int(np.rint(bin_width_s * 1e9 * 950 / 1000))
-        self._gate_length_bins = int(np.rint(record_length_s / bin_width_s))
-        actual_binwidth = self._binwidth * 1000 / 950e9
+        self._binwidth = round(bin_width_s / self._bin_duration)
+        self._gate_length_bins = round(record_length_s / bin_width_s)
+        actual_binwidth = self._binwidth * self._bin_duration
         actual_length = self._gate_length_bins * actual_binwidth
         self.statusvar = 1
         return actual_binwidth, actual_length, number_of_gates
@@ -146,15 +156,13 @@ class FastCounterDummy(FastCounterInterface):
         return self.statusvar
 
     def start_measure(self):
-        time.sleep(1)
+        if self._simulate_delay:
+            time.sleep(1)
         self.statusvar = 2
         try:
-            self._count_data = np.loadtxt(self.trace_path, dtype='int64')
+            self._count_data = self._load_trace()
         except:
             return -1
-
-        if self._gated:
-            self._count_data = self._count_data.transpose()
         return 0
 
     def pause_measure(self):
@@ -162,14 +170,16 @@ class FastCounterDummy(FastCounterInterface):
 
         Fast counter must be initially in the run state to make it pause.
         """
-        time.sleep(1)
+        if self._simulate_delay:
+            time.sleep(1)
         self.statusvar = 3
         return 0
 
     def stop_measure(self):
         """ Stop the fast counter. """
 
-        time.sleep(1)
+        if self._simulate_delay:
+            time.sleep(1)
         self.statusvar = 1
         return 0
 
@@ -196,7 +206,7 @@ class FastCounterDummy(FastCounterInterface):
 
         @return float: current length of a single bin in seconds (seconds/bin)
         """
-        width_in_seconds = self._binwidth * 1/950e6
+        width_in_seconds = self._binwidth * self._bin_duration
         return width_in_seconds
 
     def get_data_trace(self):
@@ -219,11 +229,35 @@ class FastCounterDummy(FastCounterInterface):
         """
 
         # include an artificial waiting time
-        time.sleep(0.5)
+        if self._simulate_delay:
+            time.sleep(0.5)
         info_dict = {'elapsed_sweeps': None, 'elapsed_time': None}
         return self._count_data, info_dict
 
     def get_frequency(self):
         freq = 950.
-        time.sleep(0.5)
+        if self._simulate_delay:
+            time.sleep(0.5)
         return freq
+
+    def _load_trace(self):
+        """ Load the dummy trace from file. The text file is only parsed again if it has been
+        modified since it was last loaded by any instance of this class.
+
+        In gated mode the file columns are the gates. The data is transposed to
+        [gate_index, timebin_index] once upon loading and stored C-contiguous.
+
+        @return numpy.ndarray: the read-only dummy trace data (dtype = int64)
+        """
+        key = (self.trace_path, self._gated)
+        mtime = os.stat(self.trace_path).st_mtime_ns
+        cached = self._trace_cache.get(key)
+        if cached is None or cached[0] != mtime:
+            data = np.loadtxt(self.trace_path, dtype='int64')
+            if self._gated:
+                data = np.ascontiguousarray(data.transpose())
+            # The array is shared between instances, so protect it from modification
+            data.flags.writeable = False
+            cached = (mtime, data)
+            self._trace_cache[key] = cached
+        return cached[1]
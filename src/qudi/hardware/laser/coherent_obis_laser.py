@@ -21,9 +21,9 @@ If not, see <https://www.gnu.org/licenses/>.
 
 # FIXME: Use PyVisa module instead of serial. Needs general cleanup and rework.
 import serial
-import time
 
 from qudi.core.configoption import ConfigOption
+from qudi.util.mutex import Mutex
 from qudi.interface.simple_laser_interface import SimpleLaserInterface
 from qudi.interface.simple_laser_interface import LaserState, ShutterState, ControlMode
 
@@ -46,10 +46,28 @@ class OBISLaser(SimpleLaserInterface):
 
     _com_port = ConfigOption('com_port', missing='error')
 
+    # Laser states as reported by the laser
+    _laser_states = {'ON': LaserState.ON, 'OFF': LaserState.OFF}
+    # Queries whose responses do not change while the laser is connected
+    _constant_queries = frozenset({'SYST:INF:MOD?', 'SYST:INF:MDAT?', 'SYST:INF:CDAT?',
+                                   'SYST:INF:SNUM?', 'SYST:INF:PNUM?', 'SYST:INF:FVER?',
+                                   'SYST:INF:PVER?', 'SYST:INF:WAV?', 'SYST:INF:POW?',
+                                   'SYST:INF:TYP?', 'SOUR:POW:LIM:LOW?', 'SOUR:POW:LIM:HIGH?',
+                                   'SOUR:CURR:LIM:LOW?', 'SOUR:CURR:LIM:HIGH?'})
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self._thread_lock = Mutex()
+        self._constant_responses = dict()
+
     def on_activate(self):
         """ Activate module.
         """
+        self._constant_responses = dict()
         self.obis = serial.Serial(self._com_port, timeout=1)
+        # Discard stale bytes so that responses are matched to the right query
+        self.obis.reset_input_buffer()
 
         if not self.connect_laser():
             raise RuntimeError('Laser does not seem to be connected.')
@@ -124,9 +142,9 @@ class OBISLaser(SimpleLaserInterface):
 
         @return float[2]: laser power range
         """
-        minpower = float(self._communicate('SOUR:POW:LIM:LOW?'))
-        maxpower = float(self._communicate('SOUR:POW:LIM:HIGH?'))
-        return minpower, maxpower
+        minpower, maxpower = self._communicate_multiple(['SOUR:POW:LIM:LOW?',
+                                                         'SOUR:POW:LIM:HIGH?'])
+        return float(minpower), float(maxpower)
 
     def set_power(self, power):
         """ Set laser power
@@ -147,8 +165,7 @@ class OBISLaser(SimpleLaserInterface):
 
         @return float[2]: range for laser current
         """
-        low = self._communicate('SOUR:CURR:LIM:LOW?')
-        high = self._communicate('SOUR:CURR:LIM:HIGH?')
+        low, high = self._communicate_multiple(['SOUR:CURR:LIM:LOW?', 'SOUR:CURR:LIM:HIGH?'])
         return float(low), float(high)
 
     def get_current(self):
@@ -193,10 +210,13 @@ class OBISLaser(SimpleLaserInterface):
 
         @return dict: dict of temperature names and value
         """
+        diode, internal, base_plate = self._communicate_multiple(['SOUR:TEMP:DIOD?',
+                                                                  'SOUR:TEMP:INT?',
+                                                                  'SOUR:TEMP:BAS?'])
         return {
-            'Diode': self._get_diode_temperature(),
-            'Internal': self._get_internal_temperature(),
-            'Base Plate': self._get_baseplate_temperature()
+            'Diode': self._parse_temperature(diode),
+            'Internal': self._parse_temperature(internal),
+            'Base Plate': self._parse_temperature(base_plate)
         }
 
     def get_laser_state(self):
@@ -205,11 +225,7 @@ class OBISLaser(SimpleLaserInterface):
         @return LaserState: laser state
         """
         state = self._communicate('SOUR:AM:STAT?')
-        if 'ON' in state:
-            return LaserState.ON
-        elif 'OFF' in state:
-            return LaserState.OFF
-        return LaserState.UNKNOWN
+        return self._laser_states.get(state.upper(), LaserState.UNKNOWN)
 
     def set_laser_state(self, status):
         """ Set desited laser state.
@@ -217,42 +233,35 @@ class OBISLaser(SimpleLaserInterface):
         @param LaserState status: desired laser state
         @return LaserState: actual laser state
         """
-        if self.get_laser_state() != status:
-            if status == LaserState.ON:
-                self._communicate('SOUR:AM:STAT ON')
-            elif status == LaserState.OFF:
-                self._communicate('SOUR:AM:STAT OFF')
+        # Setting the state the laser is already in is harmless, so no need to query it first
+        if status == LaserState.ON:
+            self._communicate('SOUR:AM:STAT ON')
+        elif status == LaserState.OFF:
+            self._communicate('SOUR:AM:STAT OFF')
 
     def get_extra_info(self):
         """ Extra information from laser.
 
         @return str: multiple lines of text with information about laser
         """
-        return ('System Model Name: '       + self._communicate('SYST:INF:MOD?')    + '\n'
-                'System Manufacture Date: ' + self._communicate('SYST:INF:MDAT?')   + '\n'
-                'System Calibration Date: ' + self._communicate('SYST:INF:CDAT?')   + '\n'
-                'System Serial Number: '    + self._communicate('SYST:INF:SNUM?')   + '\n'
-                'System Part Number: '      + self._communicate('SYST:INF:PNUM?')   + '\n'
-                'Firmware version: '        + self._communicate('SYST:INF:FVER?')   + '\n'
-                'System Protocol Version: ' + self._communicate('SYST:INF:PVER?')   + '\n'
-                'System Wavelength: '       + self._communicate('SYST:INF:WAV?')    + '\n'
-                'System Power Rating: '     + self._communicate('SYST:INF:POW?')    + '\n'
-                'Device Type: '             + self._communicate('SYST:INF:TYP?')    + '\n'
-                'System Power Cycles: '     + self._communicate('SYST:CYCL?')       + '\n'
-                'System Power Hours: '      + self._communicate('SYST:HOUR?')       + '\n'
-                'Diode Hours: '             + self._communicate('SYST:DIOD:HOUR?')
-                )
+        info = (('System Model Name',       'SYST:INF:MOD?'),
+                ('System Manufacture Date', 'SYST:INF:MDAT?'),
+                ('System Calibration Date', 'SYST:INF:CDAT?'),
+                ('System Serial Number',    'SYST:INF:SNUM?'),
+                ('System Part Number',      'SYST:INF:PNUM?'),
+                ('Firmware version',        'SYST:INF:FVER?'),
+                ('System Protocol Version', 'SYST:INF:PVER?'),
+                ('System Wavelength',       'SYST:INF:WAV?'),
+                ('System Power Rating',     'SYST:INF:POW?'),
+                ('Device Type',             'SYST:INF:TYP?'),
+                ('System Power Cycles',     'SYST:CYCL?'),
+                ('System Power Hours',      'SYST:HOUR?'),
+                ('Diode Hours',             'SYST:DIOD:HOUR?'))
+        responses = self._communicate_multiple([query for _, query in info])
+        return '\n'.join(f'{name}: {response}' for (name, _), response in zip(info, responses))
 
 ########################## communication methods ###############################
 
-    def _send(self, message):
-        """ Send a message to to laser
-
-        @param string message: message to be delivered to the laser
-        """
-        new_message = message + self.eol
-        self.obis.write(new_message.encode())
-
     def _communicate(self, message):
         """ Send a receive messages with the laser
 
@@ -260,51 +269,70 @@ class OBISLaser(SimpleLaserInterface):
 
         @returns string response: message received from the laser
         """
-        self._send(message)
-        time.sleep(0.1)
-        response_len = self.obis.inWaiting()
-        response = []
+        # Every response is terminated by an 'OK' or 'ERR-xxx' line, so reading returns as soon as
+        # the laser has answered instead of waiting a fixed time.
+        return self._communicate_multiple([message])[0]
 
-        while response_len > 0:
-            this_response_line = self.obis.readline().decode().strip()
-            if (response_len == 4) and (this_response_line == 'OK'):
-                response.append('')
-            else:
-                response.append(this_response_line)
-            response_len = self.obis.inWaiting()
+    def _communicate_multiple(self, messages):
+        """ Send several messages to the laser at once and receive all responses.
 
-        # Potentially multi-line responses - need to be joined into string
-        full_response = ''.join(response)
+        All messages are written in a single transfer. The laser processes them in order and
+        terminates each response with either an 'OK' or an 'ERR-xxx' line.
+        Responses to queries of constant device properties are only requested once per connection.
 
-        if full_response == 'ERR-100':
-            self.log.warning(self._model_name + ' does not support the command ' + message)
-            return '-1'
+        @param list messages: messages to be delivered to the laser
 
-        return full_response
-
-########################## internal methods ####################################
-
-    def _get_diode_temperature(self):
-        """ Get laser diode temperature
-
-        @return float: laser diode temperature
+        @returns list responses: messages received from the laser, one for each message sent
         """
-        response = float(self._communicate('SOUR:TEMP:DIOD?').split('C')[0])
-        return response
+        with self._thread_lock:
+            pending = [message for message in messages if message not in self._constant_responses]
+            if pending:
+                self.obis.write(''.join(message + self.eol for message in pending).encode())
+
+            received = list()
+            response = bytearray()
+            while len(received) < len(pending):
+                line = self.obis.readline()
+                if not line:
+                    self.log.error('Timeout while waiting for response of ' + self._model_name)
+                    break
+                line = line.strip()
+                if line == b'OK':
+                    # Potentially multi-line responses - need to be joined into string
+                    received.append(response.decode())
+                    response = bytearray()
+                elif line.startswith(b'ERR'):
+                    received.append(line.decode())
+                    response = bytearray()
+                else:
+                    response += line
+            received.extend([''] * (len(pending) - len(received)))
+
+            received_iter = iter(received)
+            responses = [self._constant_responses[message]
+                         if message in self._constant_responses else next(received_iter)
+                         for message in messages]
+            for message, response in zip(pending, received):
+                if response and message in self._constant_queries:
+                    self._constant_responses[message] = response
+
+        for ii, (message, response) in enumerate(zip(messages, responses)):
+            if response == 'ERR-100':
+                self.log.warning(self._model_name + ' does not support the command ' + message)
+                responses[ii] = '-1'
+        return responses
 
-    def _get_internal_temperature(self):
-        """ Get internal laser temperature
+########################## internal methods ####################################
 
-        @return float: internal laser temperature
-        """
-        return float(self._communicate('SOUR:TEMP:INT?').split('C')[0])
+    @staticmethod
+    def _parse_temperature(response):
+        """ Convert a temperature response of the laser (e.g. '25.01C') to a number
 
-    def _get_baseplate_temperature(self):
-        """ Get laser base plate temperature
+        @param str response: temperature as returned by the laser
 
-        @return float: laser base plate temperature
+        @return float: temperature in degrees Celsius
         """
-        return float(self._communicate('SOUR:TEMP:BAS?').split('C')[0])
+        return float(response.partition('C')[0])
 
     def _get_interlock_status(self):
         """ Get the status of the system interlock
@@ -19,6 +19,7 @@ You should have received a copy of the GNU Lesser General Public License along w
 If not, see <https://www.gnu.org/licenses/>.
 """
 
+import time
 try:
     import pyvisa as visa
 except ImportError:
@@ -38,16 +39,22 @@ class MillenniaeVLaser(SimpleLaserInterface):
         options:
             interface: 'ASRL1::INSTR'
             maxpower: 25 # in Watt
+            query_cache_time: 0.1 # in seconds, readings younger than this are reused
+            timeout: 1000 # in milliseconds, VISA communication timeout
 
     """
 
     serial_interface = ConfigOption(name='interface', default='ASRL1::INSTR', missing='warn')
     maxpower = ConfigOption(name='maxpower', default=25.0, missing='warn')
+    _query_cache_time = ConfigOption(name='query_cache_time', default=0.1, missing='nothing')
+    _timeout = ConfigOption(name='timeout', default=1000, missing='nothing')
 
     def on_activate(self):
         """ Activate Module.
         """
         self._control_mode = ControlMode.POWER
+        # Last response and its time.monotonic() timestamp for each cached query
+        self._query_cache = dict()
         self.connect_laser(self.serial_interface)
 
     def on_deactivate(self):
@@ -71,9 +78,12 @@ class MillenniaeVLaser(SimpleLaserInterface):
                 write_termination='\n',
                 read_termination='\n',
                 send_end=True)
-            self.inst.timeout = 1000
+            self.inst.timeout = self._timeout
             idn = self.inst.query('*IDN?')
             (self.mfg, self.model, self.serial, self.version) = idn.split(',')
+            # Diode current limit and diode serial number do not change while connected
+            self._current_limit = float(self.inst.query('?DCL'))
+            self._diode_serial = self.inst.query('?DSN')
         except visa.VisaIOError as e:
             self.log.exception('Communication Failure:')
             return False
@@ -114,14 +124,14 @@ class MillenniaeVLaser(SimpleLaserInterface):
 
         @return float: laser power in watts
         """
-        return float(self.inst.query('?P'))
+        return float(self._cached_query('?P'))
 
     def get_power_setpoint(self):
         """ Current laser power setpoint
 
         @return float: power setpoint in watts
         """
-        return float(self.inst.query('?PSET'))
+        return float(self._cached_query('?PSET'))
 
     def get_power_range(self):
         """ Laser power range
@@ -136,6 +146,7 @@ class MillenniaeVLaser(SimpleLaserInterface):
         @param float power: desired laser power
         """
         self.inst.query('P:{0:f}'.format(power))
+        self._query_cache.clear()
 
     def get_current_unit(self):
         """ Get unit for current
@@ -149,21 +160,21 @@ class MillenniaeVLaser(SimpleLaserInterface):
 
             @return float[2]: range for laser current
         """
-        return 0, float(self.inst.query('?DCL'))
+        return 0, self._current_limit
 
     def get_current(self):
         """ Get current laser current
 
         @return float: current laser current
         """
-        return float(self.inst.query('?C1'))
+        return float(self._cached_query('?C1'))
 
     def get_current_setpoint(self):
         """ Get laser current setpoint
 
         @return float: laser current setpoint
         """
-        return float(self.inst.query('?CS1'))
+        return float(self._cached_query('?CS1'))
 
     def set_current(self, current_percent):
         """ Set laser current setpoint
@@ -172,13 +183,14 @@ class MillenniaeVLaser(SimpleLaserInterface):
         @return float: actual laer current setpoint
         """
         self.inst.query('C:{0}'.format(current_percent))
+        self._query_cache.clear()
 
     def get_shutter_state(self):
         """ Get laser shutter state
 
         @return ShutterState: current laser shutter state
         """
-        state = self.inst.query('?SHT')
+        state = self._cached_query('?SHT')
         if 'OPEN' in state:
             return ShutterState.OPEN
         elif 'CLOSED' in state:
@@ -192,50 +204,52 @@ class MillenniaeVLaser(SimpleLaserInterface):
         @param ShuterState state: desired laser shutter state
         @return ShutterState: actual laser shutter state
         """
-        if state != self.get_shutter_state():
-            if state == ShutterState.OPEN:
-                self.inst.query('SHT:1')
-            elif state == ShutterState.CLOSED:
-                self.inst.query('SHT:0')
+        # Setting the state the shutter is already in is harmless, so no need to query it first
+        if state == ShutterState.OPEN:
+            self.inst.query('SHT:1')
+        elif state == ShutterState.CLOSED:
+            self.inst.query('SHT:0')
+        self._query_cache.clear()
 
     def get_crystal_temperature(self):
         """ Get SHG crystal temerpature.
 
         @return float: SHG crystal temperature in degrees Celsius
         """
-        return float(self.inst.query('?SHG'))
+        return float(self._cached_query('?SHG'))
 
     def get_diode_temperature(self):
         """ Get laser diode temperature.
 
         @return float: laser diode temperature in degrees Celsius
         """
-        return float(self.inst.query('?T'))
+        return float(self._cached_query('?T'))
 
     def get_tower_temperature(self):
         """ Get SHG tower temperature
 
         @return float: SHG tower temperature in degrees Celsius
         """
-        return float(self.inst.query('?TT'))
+        return float(self._cached_query('?TT'))
 
     def get_cab_temperature(self):
         """ Get cabinet temperature
 
         @return float: get laser cabinet temperature in degrees Celsius
         """
-        return float(self.inst.query('?CABTEMP'))
+        return float(self._cached_query('?CABTEMP'))
 
     def get_temperatures(self):
         """ Get all available temperatures
 
         @return dict: dict of temperature names and values
         """
+        crystal, diode, tower, cab = self._multi_query(('?SHG', '?T', '?TT', '?CABTEMP'))
         return {
-            'crystal': self.get_crystal_temperature(),
-            'diode': self.get_diode_temperature(),
-            'tower': self.get_tower_temperature(),
-            'cab': self.get_cab_temperature()
+            'crystal': float(crystal),
+            'diode': float(diode),
+            'tower': float(tower),
+            'cab': float(cab)
         }
 
     def get_laser_state(self):
@@ -243,8 +257,8 @@ class MillenniaeVLaser(SimpleLaserInterface):
 
         @return LaserState: current laser state
         """
-        diode = int(self.inst.query('?D'))
-        state = self.inst.query('?F')
+        diode, state = self._multi_query(('?D', '?F'))
+        diode = int(diode)
 
         if state in ('SYS ILK', 'KEY ILK'):
             return LaserState.LOCKED
@@ -264,27 +278,29 @@ class MillenniaeVLaser(SimpleLaserInterface):
         @param LaserState status: desited laser state
         @return LaserState: actual laser state
         """
-        if self.get_laser_state() != status:
-            if status == LaserState.ON:
-                self.inst.query('ON')
-            elif status == LaserState.OFF:
-                self.inst.query('OFF')
+        # Setting the state the laser is already in is harmless, so no need to query it first
+        if status == LaserState.ON:
+            self.inst.query('ON')
+        elif status == LaserState.OFF:
+            self.inst.query('OFF')
+        self._query_cache.clear()
 
     def dump(self):
         """ Dump laser information.
 
         @return str: laser information
         """
-        return 'Didoe Serial: {0}\n'.format(self.inst.query('?DSN'))
+        return 'Didoe Serial: {0}\n'.format(self._diode_serial)
 
     def timers(self):
         """ Laser component runtimes
 
         @return str: laser component run times
         """
-        lines = 'Diode ON: {0}\n'.format(self.inst.query('?DH'))
-        lines += 'Head ON: {0}\n'.format(self.inst.query('?HEADHRS'))
-        lines += 'PSU ON: {0}\n'.format(self.inst.query('?PSHRS'))
+        diode, head, psu = self._multi_query(('?DH', '?HEADHRS', '?PSHRS'))
+        lines = 'Diode ON: {0}\n'.format(diode)
+        lines += 'Head ON: {0}\n'.format(head)
+        lines += 'PSU ON: {0}\n'.format(psu)
         return lines
 
     def get_extra_info(self):
@@ -297,3 +313,31 @@ class MillenniaeVLaser(SimpleLaserInterface):
         extra += '\n {0}'.format(self.timers())
         extra += '\n'
         return extra
+
+    def _cached_query(self, command):
+        """ Query the laser, reusing a response that is younger than the query cache time.
+
+        Several pollers asking for the same reading within the cache time cause only a single
+        transaction. Setting any laser parameter empties the cache.
+
+        @param str command: query command to send
+
+        @return str: response of the laser
+        """
+        now = time.monotonic()
+        cached = self._query_cache.get(command)
+        if cached is not None and now - cached[0] < self._query_cache_time:
+            return cached[1]
+        response = self.inst.query(command)
+        self._query_cache[command] = (now, response)
+        return response
+
+    def _multi_query(self, commands):
+        """ Send several queries in a single write and read back one response line per query.
+
+        @param tuple commands: query commands to send
+
+        @return list: response strings in the order of the queries
+        """
+        self.inst.write('\n'.join(commands))
+        return [self.inst.read() for _ in commands]
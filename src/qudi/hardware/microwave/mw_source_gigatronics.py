@@ -20,10 +20,7 @@ You should have received a copy of the GNU Lesser General Public License along w
 If not, see <https://www.gnu.org/licenses/>.
 """
 
-try:
-    import pyvisa as visa
-except ImportError:
-    import visa
+import pyvisa as visa
 import time
 import numpy as np
 
@@ -43,10 +40,12 @@ class MicrowaveGigatronics(MicrowaveInterface):
         options:
             visa_address: 'GPIB0::12::INSTR'
             comm_timeout: 10  # in seconds, optional
+            binary_list_transfer: False  # send frequency list as IEEE 488.2 binary block, optional
     """
 
     _visa_address = ConfigOption('visa_address', missing='error')
     _comm_timeout = ConfigOption('comm_timeout', default=10, missing='warn')
+    _binary_list_transfer = ConfigOption('binary_list_transfer', default=False, missing='nothing')
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -61,15 +60,20 @@ class MicrowaveGigatronics(MicrowaveInterface):
         self._scan_power = -20
         self._scan_frequencies = None
         self._scan_sample_rate = 0.
+        # Last frequency/power written to the device (None if unknown)
+        self._written_frequency = None
+        self._written_power = None
 
     def on_activate(self):
         """ Initialisation performed during activation of the module.
         """
         # trying to load the visa connection to the module
         self._rm = visa.ResourceManager()
+        # Large chunk size to read back long responses with as few low-level VISA reads as possible
         self._device = self._rm.open_resource(self._visa_address,
                                               read_termination='\r\n',
-                                              timeout=int(self._comm_timeout * 1000))
+                                              timeout=int(self._comm_timeout * 1000),
+                                              chunk_size=1024 * 1024)
 
         # Reset device
         self._device.write('*RST')
@@ -108,6 +112,8 @@ class MicrowaveGigatronics(MicrowaveInterface):
         self._cw_power = self._constraints.min_power
         self._cw_frequency = 2870.0e6
         self._scan_sample_rate = self._constraints.max_sample_rate
+        self._written_frequency = None
+        self._written_power = None
 
     def on_deactivate(self):
         """ Cleanup performed during deactivation of the module.
@@ -206,10 +212,15 @@ class MicrowaveGigatronics(MicrowaveInterface):
             if not self._in_cw_mode():
                 self._command_wait(':MODE CW')
 
-            self._command_wait(f':FREQ {frequency:e}')
-            self._command_wait(f':POW {power:f} DBM')
-            self._cw_power = float(self._device.query(':POW?'))
-            self._cw_frequency = float(self._device.query(':FREQ?'))
+            # Skip GPIB round-trips for values already present on the device
+            if frequency != self._written_frequency:
+                self._command_wait(f':FREQ {frequency:e}')
+                self._written_frequency = frequency
+                self._cw_frequency = float(self._device.query(':FREQ?'))
+            if power != self._written_power:
+                self._command_wait(f':POW {power:f} DBM')
+                self._written_power = power
+                self._cw_power = float(self._device.query(':POW?'))
 
     def configure_scan(self, power, frequencies, mode, sample_rate):
         """
@@ -254,6 +265,8 @@ class MicrowaveGigatronics(MicrowaveInterface):
                 self._command_wait(':MODE CW')
                 self._command_wait(f':FREQ {self._cw_frequency:e}')
                 self._command_wait(f':POW {self._cw_power:f} DBM')
+                self._written_frequency = self._cw_frequency
+                self._written_power = self._cw_power
 
             self._device.write(':OUTP:STAT ON')
             while int(float(self._device.query(':OUTP:STAT?'))) == 0:
@@ -301,39 +314,58 @@ class MicrowaveGigatronics(MicrowaveInterface):
 
         @param str command_str: The command to be written
         """
-        self._device.write(command_str)
-        self._device.write('*WAI')
+        self._device.write(f'{command_str};*WAI')
         while int(float(self._device.query('*OPC?'))) != 1:
             time.sleep(0.2)
 
     def _in_cw_mode(self):
         return self._device.query(':MODE?').strip('\n').lower() == 'cw'
 
+    def _write_frequency_list(self, freq_list):
+        """Writes the list of frequencies in Hz to the device list memory. Uses an IEEE 488.2
+        binary block if configured and falls back to an ASCII list if the transfer fails.
+
+        @param list freq_list: The frequencies in Hz to write
+        """
+        if self._binary_list_transfer:
+            try:
+                self._device.write_binary_values('LIST:FREQ ',
+                                                 freq_list,
+                                                 datatype='d',
+                                                 is_big_endian=True)
+                return
+            except visa.VisaIOError:
+                self.log.warning('Binary transfer of frequency list failed. Falling back to '
+                                 'ASCII transfer.')
+        freq_str = ','.join([f'{freq:.1f}' for freq in freq_list])
+        self._device.write(f'LIST:FREQ {freq_str}')
+
     def _write_list(self):
         if not self._in_cw_mode():
             self._command_wait(':MODE CW')
 
         self._command_wait(f':FREQ {self._scan_frequencies[0]:e}')
         self._command_wait(f':POW {self._scan_power:f} DBM')
+        # CW settings on the device have been overwritten by the scan settings
+        self._written_frequency = None
+        self._written_power = None
 
         # self._device.write('*SRE 0')
         self._device.write(':LIST:SEQ:AUTO ON')
 
-        freq_str = f'{self._scan_frequencies[0]:.1f},'
-        freq_str += ','.join(f'{freq:.1f}' for freq in self._scan_frequencies)
-        self._device.write(f'LIST:FREQ {freq_str}')
+        # The first frequency is listed twice, so the list holds one point more than the scan
+        freq_list = [self._scan_frequencies[0], *self._scan_frequencies]
+        self._write_frequency_list(freq_list)
 
-        pow_str = f'{self._scan_power:.3f}'
-        pow_str = ','.join([pow_str] * (len(self._scan_frequencies) + 1))
+        pow_str = ','.join([f'{self._scan_power:.3f}'] * len(freq_list))
         self._device.write(f'LIST:POW {pow_str}')
 
-        self._device.write('LIST:DWEL 0.002000 S')
-        self._device.write('LIST:RFOffTime 0.000000 MS')
-        self._device.write('*OPC?')
-        self._device.write('LIST:PREC 1')
+        # Independent setup commands are chained into compound SCPI messages to save GPIB
+        # round-trips. Each command is given with its absolute path (leading colon).
+        self._device.write(':LIST:DWEL 0.002000 S;:LIST:RFOffTime 0.000000 MS;*OPC?')
+        self._device.write(':LIST:PREC 1')
         # wait for '1' from OPC
         self._device.read()
-        self._device.write(':LIST:REP STEP')
-        self._device.write(':TRIG:SOUR EXT')
+        self._device.write(':LIST:REP STEP;:TRIG:SOUR EXT')
         # self._device.write('*SRE 239')
         # self._device.write('*SRE 167')
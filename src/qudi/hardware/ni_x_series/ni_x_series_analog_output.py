@@ -24,6 +24,8 @@ top-level directory of this distribution and at <https://github.com/Ulm-IQO/qudi
 # ToDo: Handle case where zero volts is not a good default value
 
 import nidaqmx as ni
+from typing import Mapping
+from nidaqmx.stream_writers import AnalogSingleChannelWriter
 
 from qudi.util.mutex import Mutex
 from qudi.core.configoption import ConfigOption
@@ -87,26 +89,29 @@ class NIXSeriesAnalogOutput(ProcessControlSwitchMixin, ProcessSetpointInterface)
         self._constraints = None
         self._device_channel_mapping = dict()
         self._ao_task_handles = dict()
+        self._ao_writers = dict()
         self._keep_values = dict()
+        self._channel_limits = dict()
 
     def on_activate(self):
         """ Starts up the NI-card and performs sanity checks """
         # Check if device is connected and set device to use
         self._device_channel_mapping = dict()
         self._ao_task_handles = dict()
+        self._ao_writers = dict()
         self._keep_values = dict()
 
         # Sanitize channel configuration
         ao_limits = ao_voltage_range(self._device_name)
         valid_channels = ao_channel_names(self._device_name)
-        valid_channels_lower = [name.lower() for name in valid_channels]
+        valid_channels_lower = {name.lower(): name for name in valid_channels}
         limits = dict()
         for ch_name in natural_sort(self._channels_config):
             ch_cfg = self._channels_config[ch_name]
             norm_name = normalize_channel_name(ch_name).lower()
             try:
-                device_name = valid_channels[valid_channels_lower.index(norm_name)]
-            except (ValueError, IndexError):
+                device_name = valid_channels_lower[norm_name]
+            except KeyError:
                 self.log.error(f'Invalid analog output channel "{ch_name}" configured. Channel '
                                f'will be ignored.\nValid analog output channels are: '
                                f'{valid_channels}')
@@ -127,6 +132,9 @@ class NIXSeriesAnalogOutput(ProcessControlSwitchMixin, ProcessSetpointInterface)
             self._keep_values[ch_name] = bool(ch_cfg.get('keep_value', True))
             limits[ch_name] = ch_limits
 
+        # Keep channel limits at hand for the setpoint checks
+        self._channel_limits = limits
+
         # Initialization of hardware constraints defined in the config file
         self._constraints = ProcessControlConstraints(
             setpoint_channels=self._device_channel_mapping,
@@ -184,7 +192,7 @@ class NIXSeriesAnalogOutput(ProcessControlSwitchMixin, ProcessSetpointInterface)
             return self._get_activity_state(channel)
 
     def _get_activity_state(self, channel: str) -> bool:
-        if channel not in self.constraints.all_channels:
+        if channel not in self._device_channel_mapping:
             raise ValueError(f'Invalid channel specifier "{channel}". Valid channels are:\n'
                              f'{self.constraints.all_channels}')
         return channel in self._ao_task_handles
@@ -200,14 +208,31 @@ class NIXSeriesAnalogOutput(ProcessControlSwitchMixin, ProcessSetpointInterface)
         """ Set new setpoint for a single channel """
         value = float(value)
         with self._thread_lock:
-            if not self._get_activity_state(channel):
-                raise RuntimeError(f'Please activate channel "{channel}" before setting setpoint')
-            if not self.constraints.channel_value_in_range(channel, value)[0]:
-                raise ValueError(f'Setpoint {value} for channel "{channel}" out of allowed '
-                                 f'value bounds {self.constraints.channel_limits[channel]}')
+            self._check_setpoint(channel, value)
             self._write_ao_value(channel, value)
             self._setpoints[channel] = value
 
+    @ProcessSetpointInterface.setpoints.setter
+    def setpoints(self, values: Mapping[str, float]) -> None:
+        """ Set the setpoints (values) for all channels (keys) at once.
+        All setpoints are checked before the first one is written.
+        """
+        values = {channel: float(value) for channel, value in values.items()}
+        with self._thread_lock:
+            for channel, value in values.items():
+                self._check_setpoint(channel, value)
+            for channel, value in values.items():
+                self._write_ao_value(channel, value)
+                self._setpoints[channel] = value
+
+    def _check_setpoint(self, channel: str, value: float) -> None:
+        if not self._get_activity_state(channel):
+            raise RuntimeError(f'Please activate channel "{channel}" before setting setpoint')
+        min_val, max_val = self._channel_limits[channel]
+        if not min_val <= value <= max_val:
+            raise ValueError(f'Setpoint {value} for channel "{channel}" out of allowed '
+                             f'value bounds {self._channel_limits[channel]}')
+
     def get_setpoint(self, channel: str) -> float:
         """ Get current setpoint for a single channel """
         with self._thread_lock:
@@ -219,8 +244,9 @@ class NIXSeriesAnalogOutput(ProcessControlSwitchMixin, ProcessSetpointInterface)
         """ Reset analog output to 0 if keep_values flag is not set """
         try:
             if not self._keep_values[channel]:
-                self._write_ao_value(0)
+                self._write_ao_value(channel, 0)
             task = self._ao_task_handles.pop(channel)
+            del self._ao_writers[channel]
         except KeyError:
             return
         try:
@@ -249,9 +275,11 @@ class NIXSeriesAnalogOutput(ProcessControlSwitchMixin, ProcessSetpointInterface)
                 pass
             raise RuntimeError('Error while configuring NI analog out task') from err
         self._ao_task_handles[channel] = ao_task
+        # Stream writer avoids the data type/shape introspection of Task.write on every sample
+        self._ao_writers[channel] = AnalogSingleChannelWriter(ao_task.out_stream, auto_start=True)
 
     def _write_ao_value(self, channel: str, value: float) -> None:
-        self._ao_task_handles[channel].write(value)
+        self._ao_writers[channel].write_one_sample(value)
 
     def _sanitize_setpoint_status(self) -> None:
         # Remove obsolete channels and out-of-bounds values
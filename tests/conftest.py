@@ -10,7 +10,7 @@ import os
 
 CONFIG = os.path.join(os.getcwd(),'tests/test.cfg')
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def qt_app():
     app_cls = QtWidgets.QApplication
     app = app_cls.instance()
@@ -18,7 +18,7 @@ def qt_app():
         app = app_cls()
     return app
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def qudi_instance():
     instance = application.Qudi.instance()
     if instance is None:
@@ -26,14 +26,29 @@ def qudi_instance():
     instance_weak = weakref.ref(instance)
     return instance_weak()
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def module_manager(qudi_instance):
     return qudi_instance.module_manager
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def config():
     configuration = (yaml_load(CONFIG))
     return configuration
 
 
-
+#@pytest.fixture(scope='session', autouse=True)
+#Uncomment the above line to enable the coverage fixture
+def coverage_for_session():
+    # Only import coverage when the fixture is enabled
+    import coverage
+    # PEP 669 monitoring is much cheaper than the sys.settrace based tracer
+    if sys.version_info >= (3, 12):
+        os.environ.setdefault('COVERAGE_CORE', 'sysmon')
+    cov = coverage.Coverage()
+    cov.start()
+    yield
+    cov.stop()
+
+    report_dir = 'coverage_report'
+    cov.html_report(directory=report_dir)
+    print(f"Coverage report saved to {report_dir}")
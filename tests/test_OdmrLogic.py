@@ -27,7 +27,6 @@ from PySide2 import QtCore, QtWidgets
 import weakref
 from qudi.util.yaml import yaml_load
 import os
-import coverage
 import time
 import math
 
@@ -59,34 +58,25 @@ def scanner(module):
 def microwave(module):
     return module._microwave()
 
+@pytest.fixture(scope='module')
+def odmr_range(scanner):
+    return get_odmr_range(5, scanner)
+
 def get_odmr_range(length, scanner):
-    scanner.__simulate_odmr(length)
+    scanner._FiniteSamplingInputDummy__simulate_odmr(length)
     data = scanner._FiniteSamplingInputDummy__simulated_samples
-    signal_data_range = {channel: ( get_tolerance(min(data[channel]), bound = 'lower'), get_tolerance( max(data[channel]), bound='upper')  ) for channel in data}
+    signal_data_range = dict()
+    for channel, samples in data.items():
+        samples = np.asarray(samples)
+        signal_data_range[channel] = (get_tolerance(samples.min(), bound='lower'),
+                                      get_tolerance(samples.max(), bound='upper'))
     return signal_data_range
 
 def get_tolerance(value, bound):
     return int(value + value * TOLERANCE/100) if bound == 'upper' else int(value - value * TOLERANCE/100)
 
 
-#@pytest.fixture(autouse=True)
-#Uncomment the above line to enable the coverage fixture
-def coverage_for_each_test(request):
-    cov = coverage.Coverage()
-    cov.start()
-    yield
-    cov.stop()
-    
-    test_dir =  f"coverage_{request.node.nodeid.replace('/', '_').replace(':', '_')}"
-    os.makedirs(test_dir, exist_ok=True)
-    
-    cov.html_report(directory=test_dir)
-    cov.save()
-
-    print(f"Coverage report saved to {test_dir}")
-
-
-def test_start_odmr_scan(module, scanner, qtbot):
+def test_start_odmr_scan(module, scanner, odmr_range, qtbot):
     """This tests if the scan parameters such as frequency and signal data are correctly generated,
       and if the signal data is generated for the given runtime with appropriate values
 
@@ -96,33 +86,37 @@ def test_start_odmr_scan(module, scanner, qtbot):
         Fixture for instance of Odmr logic module
     scanner : fixture
         Fixture for connected instance of Finite sampling input dummy for data scanning
+    odmr_range : fixture
+        Fixture for the expected signal data range of each channel
     qtbot : fixture
         Fixture for qt support
     """    
-    freq_low, freq_high, freq_counts = list(map(int, module.frequency_ranges[0]))
+    freq_low, freq_high, freq_counts = map(int, module.frequency_ranges[0])
     frequency_data = module.frequency_data
     assert len(frequency_data) == module.frequency_range_count
     for data_range in frequency_data:
+        data_range = np.asarray(data_range)
         assert len(data_range) == freq_counts
-        for freq_value in data_range:
-            assert isinstance(freq_value, float)
-            assert int(freq_value) in range(freq_low, freq_high+1)
+        assert data_range.dtype.kind == 'f'
+        freq_values = data_range.astype(int)
+        assert np.all((freq_values >= freq_low) & (freq_values <= freq_high))
     
-    module.start_odmr_scan()
-    run_time = int(module._run_time) 
-    with qtbot.waitSignals( [module._sigNextLine]*run_time, timeout = run_time*1500) as blockers:
-        pass
-    time.sleep(run_time)
+    run_time = int(module._run_time)
+    # The scan stops itself once the run time has elapsed
+    with qtbot.waitSignal(module.sigScanStateUpdated, timeout=run_time*1500,
+                          check_params_cb=lambda running: not running):
+        module.start_odmr_scan()
     signal_data = module.signal_data
     assert len(signal_data) == len(scanner.active_channels)
-    odmr_range = get_odmr_range(5, scanner)
     for channel in signal_data:
+        low, high = odmr_range[channel]
         for values in signal_data[channel]:
+            values = np.asarray(values)
             assert len(values) == freq_counts
-            for value in values:
-                assert isinstance(value,float)
-                assert not math.isnan(value)
-                assert int(value) in range(*odmr_range[channel])
+            assert values.dtype.kind == 'f'
+            assert not np.isnan(values).any()
+            int_values = values.astype(int)
+            assert np.all((int_values >= low) & (int_values < high))
     #print(f'elspased sweeps {module._elapsed_sweeps}') 
 
 
@@ -155,26 +149,23 @@ def test_save_odmr_data(module):
     """  
     save_dir = module.module_default_data_dir
     if os.path.exists(save_dir):
-        saved_files = os.listdir(save_dir)
-        saved_files = [os.path.join(save_dir, file) for file in saved_files]
-        creation_times = np.array([os.path.getmtime(file) for file in saved_files])
         current_time = time.time()
-        time_diffs =   current_time - creation_times
-        assert(not any(time_diffs<5)) # no files should be created in the last 5 secs before saving
+        # no files should be created in the last 5 secs before saving
+        with os.scandir(save_dir) as entries:
+            assert not any(current_time - entry.stat().st_mtime < 5 for entry in entries)
         
     module.save_odmr_data()
     
-    saved_files = os.listdir(save_dir)
-    saved_files = [os.path.join(save_dir, file) for file in saved_files]
-    creation_times = np.array([os.path.getmtime(file) for file in saved_files])
     current_time = time.time()
-    time_diffs = current_time - creation_times
-    recent_saved_files = [saved_file for saved_file,time_diff in zip(saved_files, time_diffs) if time_diff<5]
-    data_files = [recent_saved_file for recent_saved_file in recent_saved_files if os.path.splitext(recent_saved_file)[1] == '.dat']
-    signal_data_file = [data_file for data_file in data_files if 'signal' in data_file][0]
-    saved_signal_data = np.loadtxt(signal_data_file)
+    with os.scandir(save_dir) as entries:
+        signal_data_file = next((entry.path for entry in entries
+                                 if entry.name.endswith('.dat') and 'signal' in entry.name
+                                 and current_time - entry.stat().st_mtime < 5), None)
+    assert signal_data_file is not None, f'No recently saved ODMR signal data file in {save_dir}'
+    # only parse the signal columns, the first column holds the frequencies
+    saved_signal_data = np.loadtxt(signal_data_file, usecols=range(1, len(CHANNELS) + 1), ndmin=2)
     for i,channel in enumerate(CHANNELS):
-        saved_channel_data = [saved_signal_row[i+1]  for saved_signal_row in saved_signal_data]
-        actual_channel_data = module.signal_data[channel][0]
-        for saved_value, actual_value in zip(saved_channel_data, actual_channel_data):
-            assert np.isclose(saved_value, actual_value)
\ No newline at end of file
+        saved_channel_data = saved_signal_data[:, i]
+        actual_channel_data = np.asarray(module.signal_data[channel][0])
+        assert saved_channel_data.shape == actual_channel_data.shape
+        assert np.allclose(saved_channel_data, actual_channel_data)
\ No newline at end of file